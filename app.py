@@ -3,8 +3,8 @@ import streamlit as st
 import cv2
 import numpy as np
 import os
-from collections import deque
 from PIL import Image
+from solver import find_path
 
 # Set page config
 st.set_page_config(page_title="Maze Solver", page_icon="🧩", layout="wide")
@@ -99,43 +99,7 @@ def image_to_grid(img):
     # Convert to grayscale and threshold
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
     _, binary = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
-    return np.where(binary >= 250, 1, 0)
-
-def bfs(grid, start, end):
-    """Breadth-first search pathfinding"""
-    rows, cols = grid.shape
-    visited = np.zeros_like(grid, dtype=bool)
-    prev = {}
-    queue = deque([start])
-    visited[start] = True
-
-    while queue:
-        r, c = queue.popleft()
-        if (r, c) == end:
-            break
-
-        for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols:
-                if grid[nr, nc] == 1 and not visited[nr, nc]:
-                    visited[nr, nc] = True
-                    queue.append((nr, nc))
-                    prev[(nr, nc)] = (r, c)
-
-    return prev
-
-def reconstruct_path(prev, start, end):
-    """Rebuild path from BFS predecessor dictionary"""
-    path = []
-    current = end
-    while current != start:
-        if current not in prev:
-            return []
-        path.append(current)
-        current = prev[current]
-    path.append(start)
-    path.reverse()
-    return path
+    return np.where(binary >= 250, 1, 0).astype(np.uint8)
 
 def draw_path(img, path, color=(0, 0, 255), thickness=2):
     """Draw solution path on the image"""
@@ -178,8 +142,7 @@ def solve_maze(image):
     grid = image_to_grid(img)
     
     # Solve maze
-    prev = bfs(grid, start, end)
-    path = reconstruct_path(prev, start, end)
+    path = find_path(grid, start, end)
     
     if not path:
         st.error("❌ No path could be found through the maze.")
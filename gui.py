@@ -5,7 +5,7 @@ import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton, 
                             QFileDialog, QVBoxLayout, QWidget, QSpinBox, QHBoxLayout)
 from PyQt5.QtGui import QPixmap, QImage
-from solver import image_to_grid, bfs, reconstruct_path, draw_path
+from solver import image_to_grid, find_path, draw_path
 
 class MazeSolverApp(QMainWindow):
     def __init__(self):
@@ -108,8 +108,7 @@ class MazeSolverApp(QMainWindow):
         grid = image_to_grid(self.image)
         
         # Solve maze
-        prev = bfs(grid, start, end)
-        path = reconstruct_path(prev, start, end)
+        path = find_path(grid, start, end)
         
         if path:
             # Draw solution
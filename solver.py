@@ -3,6 +3,12 @@ import numpy as np
 import os
 from collections import deque
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 def load_start_end_points(file_path="points.txt"):
     try:
         with open(file_path, "r") as f:
@@ -37,7 +43,7 @@ def image_to_grid(img, white_threshold=240):
 
     # Now convert to grayscale and threshold
     gray = cv2.cvtColor(clean_img, cv2.COLOR_BGR2GRAY)
-    grid = np.where(gray >= white_threshold, 1, 0)
+    grid = np.where(gray >= white_threshold, 1, 0).astype(np.uint8)
 
     return grid
 
@@ -76,6 +82,86 @@ def reconstruct_path(prev, start, end):
     path.reverse()
     return path
 
+if HAS_NUMBA:
+    # Compiled kernels over the uint8 grid. nogil lets GUI/Streamlit worker
+    # threads run them in parallel; cache=True keeps the compiled code in
+    # __pycache__ so the JIT cost is only paid once.
+    @njit(cache=True, nogil=True)
+    def _bfs_kernel(grid, sr, sc, er, ec):
+        rows, cols = grid.shape
+        prev = np.full(rows * cols, -1, dtype=np.int64)
+        visited = np.zeros(rows * cols, dtype=np.uint8)
+        queue = np.empty(rows * cols, dtype=np.int64)
+        drs = (-1, 1, 0, 0)
+        dcs = (0, 0, -1, 1)
+
+        head = 0
+        tail = 1
+        queue[0] = sr * cols + sc
+        visited[sr * cols + sc] = 1
+
+        while head < tail:
+            cur = queue[head]
+            head += 1
+            r = cur // cols
+            c = cur % cols
+            if r == er and c == ec:
+                break
+
+            for k in range(4):
+                nr = r + drs[k]
+                nc = c + dcs[k]
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    idx = nr * cols + nc
+                    if grid[nr, nc] == 1 and visited[idx] == 0:
+                        visited[idx] = 1
+                        queue[tail] = idx
+                        tail += 1
+                        prev[idx] = cur
+
+        return prev
+
+    @njit(cache=True, nogil=True)
+    def _reconstruct_kernel(prev, cols, sr, sc, er, ec):
+        start = sr * cols + sc
+        current = er * cols + ec
+        length = 1
+        while current != start:
+            current = prev[current]
+            if current < 0:
+                return np.empty((0, 2), dtype=np.int64)
+            length += 1
+
+        path = np.empty((length, 2), dtype=np.int64)
+        current = er * cols + ec
+        for i in range(length - 1, -1, -1):
+            path[i, 0] = current // cols
+            path[i, 1] = current % cols
+            current = prev[current]
+        return path
+
+def find_path(grid, start, end):
+    """
+    Shortest path from start to end as a list of (row, col) tuples.
+    Uses the compiled Numba kernels when numba is installed, otherwise
+    falls back to bfs + reconstruct_path. Both return the same path.
+    Returns [] if no path exists or an endpoint lies outside the grid.
+    """
+    start = (int(start[0]), int(start[1]))
+    end = (int(end[0]), int(end[1]))
+    rows, cols = grid.shape
+    for r, c in (start, end):
+        if not (0 <= r < rows and 0 <= c < cols):
+            return []
+
+    if not HAS_NUMBA:
+        return reconstruct_path(bfs(grid, start, end), start, end)
+
+    grid = np.ascontiguousarray(grid, dtype=np.uint8)
+    prev = _bfs_kernel(grid, start[0], start[1], end[0], end[1])
+    path = _reconstruct_kernel(prev, grid.shape[1], start[0], start[1], end[0], end[1])
+    return [(int(r), int(c)) for r, c in path]
+
 def draw_path(img, path, color=(255, 0, 0), thickness=1):
     for (r, c) in path:
         cv2.circle(img, (c, r), thickness, color, -1)
@@ -91,8 +177,7 @@ def solve_maze(input_image_path="maze_marked.png", output_path="solution.png"):
 
         start, end = load_start_end_points()
         grid = image_to_grid(img)
-        prev = bfs(grid, start, end)
-        path = reconstruct_path(prev, start, end)
+        path = find_path(grid, start, end)
 
         if not path:
             print("No path found in the maze.")
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import solver
+
+
+@pytest.fixture(params=["python", "numba"])
+def backend(request, monkeypatch):
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        assert solver.HAS_NUMBA
+    else:
+        monkeypatch.setattr(solver, "HAS_NUMBA", False)
+    return request.param
+
+
+def reference_path(grid, start, end):
+    return solver.reconstruct_path(solver.bfs(grid, start, end), start, end)
+
+
+def random_grid(seed, shape=(40, 60), wall_ratio=0.3):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random(shape) > wall_ratio).astype(np.uint8)
+    grid[0, 0] = 1
+    grid[-1, -1] = 1
+    return grid
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_grids_match_reference(backend, seed):
+    grid = random_grid(seed)
+    start, end = (0, 0), (grid.shape[0] - 1, grid.shape[1] - 1)
+    assert solver.find_path(grid, start, end) == reference_path(grid, start, end)
+
+
+def test_unreachable_end(backend):
+    grid = np.ones((5, 5), dtype=np.uint8)
+    grid[:, 2] = 0
+    assert solver.find_path(grid, (0, 0), (4, 4)) == []
+
+
+def test_start_equals_end(backend):
+    grid = np.ones((5, 5), dtype=np.uint8)
+    assert solver.find_path(grid, (2, 3), (2, 3)) == [(2, 3)]
+
+
+def test_start_on_wall(backend):
+    grid = np.ones((5, 5), dtype=np.uint8)
+    grid[0, 0] = 0
+    path = solver.find_path(grid, (0, 0), (4, 4))
+    assert path == reference_path(grid, (0, 0), (4, 4))
+    assert path[0] == (0, 0) and path[-1] == (4, 4)
+
+
+@pytest.mark.parametrize("start, end", [
+    ((0, 0), (0, 7)),
+    ((0, 0), (10, 10)),
+    ((0, 0), (-1, -1)),
+    ((7, 0), (4, 4)),
+    ((-1, 0), (4, 4)),
+])
+def test_out_of_bounds_endpoints(backend, start, end):
+    grid = np.ones((5, 5), dtype=np.uint8)
+    assert solver.find_path(grid, start, end) == []